@@ -7,11 +7,15 @@ A structured protocol for accountable AI agent communication.
 from .runtime import (
     make_message,
     validate_vlp,
+    validate_vlp_batch,
     new_id,
+    random_hex,
     now_iso,
     to_ndjson,
+    to_ndjson_stream,
     from_ndjson,
 )
+from .batch import MessageBatch
 from .sessions import (
     AgentSession,
     AgentSessionRegistry,
@@ -22,10 +26,14 @@ __version__ = "1.1.0"
 __all__ = [
     "make_message",
     "validate_vlp",
+    "validate_vlp_batch",
     "new_id",
+    "random_hex",
     "now_iso",
     "to_ndjson",
+    "to_ndjson_stream",
     "from_ndjson",
+    "MessageBatch",
     "AgentSession",
     "AgentSessionRegistry",
     "get_registry",
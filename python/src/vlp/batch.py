@@ -0,0 +1,126 @@
+"""
+VLP v1.1 Message Batches.
+
+Column-oriented storage for bulk filtering, export and validation.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+# Canonical field order, matching the dicts built by make_message
+_FIELDS = (
+    "id",
+    "protocol",
+    "type",
+    "timestamp",
+    "session_id",
+    "seq",
+    "sender",
+    "receiver",
+    "topic",
+    "content",
+    "confidence",
+    "provenance",
+    "constraints",
+    "safety",
+    "refers_to",
+    "keywords",
+    "payload",
+    "_extras",
+)
+_FIELD_SET = frozenset(_FIELDS)
+
+# Marks a field absent from a message (distinct from an explicit None)
+_MISSING = object()
+
+
+class MessageBatch:
+    """
+    Column-oriented ("struct of arrays") collection of VLP messages.
+
+    Each canonical field is stored in its own list, so bulk operations that
+    look at one field (e.g. filtering by confidence) walk a single list
+    instead of every message dict. Iterating a batch yields message dicts,
+    so it can be passed straight to to_ndjson, to_ndjson_stream or
+    validate_vlp_batch.
+
+    Usage:
+        batch = MessageBatch(messages)
+        confident = batch.where(type_="claim", min_confidence=0.9)
+        ndjson = to_ndjson(confident)
+    """
+
+    def __init__(self, messages: Iterable[Dict[str, Any]] = ()):
+        self._columns: Dict[str, List[Any]] = {name: [] for name in _FIELDS}
+        # Non-canonical keys per message, or None when there are none
+        self._other: List[Optional[Dict[str, Any]]] = []
+        self.extend(messages)
+
+    def __len__(self) -> int:
+        return len(self._other)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        rows = zip(*self._columns.values())
+        for values, other in zip(rows, self._other):
+            yield self._materialize(values, other)
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        values = [col[index] for col in self._columns.values()]
+        return self._materialize(values, self._other[index])
+
+    @staticmethod
+    def _materialize(values: Sequence[Any], other: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Rebuild a message dict from one row of column values."""
+        msg = {name: v for name, v in zip(_FIELDS, values) if v is not _MISSING}
+        if other:
+            msg.update(other)
+        return msg
+
+    def append(self, msg: Dict[str, Any]) -> None:
+        """Add a message to the batch."""
+        get = msg.get
+        for name, col in self._columns.items():
+            col.append(get(name, _MISSING))
+        other = {k: v for k, v in msg.items() if k not in _FIELD_SET}
+        self._other.append(other or None)
+
+    def extend(self, messages: Iterable[Dict[str, Any]]) -> None:
+        """Add several messages to the batch."""
+        for msg in messages:
+            self.append(msg)
+
+    def column(self, name: str) -> List[Any]:
+        """Get the values of one canonical field, with None where absent."""
+        return [None if v is _MISSING else v for v in self._columns[name]]
+
+    def take(self, indices: Iterable[int]) -> "MessageBatch":
+        """Return a new batch containing the messages at the given indices."""
+        indices = list(indices)
+        out = MessageBatch()
+        for name, col in self._columns.items():
+            out._columns[name] = [col[i] for i in indices]
+        out._other = [self._other[i] for i in indices]
+        return out
+
+    def where(
+        self,
+        type_: Optional[str] = None,
+        min_confidence: Optional[float] = None,
+        session_id: Optional[str] = None,
+    ) -> "MessageBatch":
+        """Return a new batch with the messages matching all given criteria."""
+        indices: Iterable[int] = range(len(self))
+        if type_ is not None:
+            types = self._columns["type"]
+            indices = [i for i in indices if types[i] == type_]
+        if min_confidence is not None:
+            confidences = self._columns["confidence"]
+            indices = [
+                i for i in indices
+                if isinstance(confidences[i], (int, float)) and confidences[i] >= min_confidence
+            ]
+        if session_id is not None:
+            sessions = self._columns["session_id"]
+            indices = [i for i in indices if sessions[i] == session_id]
+        return self.take(indices)
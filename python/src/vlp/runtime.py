@@ -4,28 +4,67 @@ VLP v1.1 Runtime - Message creation and validation.
 
 from __future__ import annotations
 
-import datetime
-import json
-import uuid
-from typing import Any, Dict, List, Optional, Tuple
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, Tuple
 
-from jsonschema import ValidationError, validate
+import orjson
 
-from .schema import vlp_1_1
+from . import schema as _schema
+
+
+_RND_CHUNK = 1024
+_rnd = threading.local()
+
+if hasattr(os, "register_at_fork"):
+    # A forked child must not replay the parent's buffered random bytes
+    os.register_at_fork(after_in_child=lambda: _rnd.__dict__.clear())
+
+
+def random_hex(nbytes: int) -> str:
+    """
+    Return 2 * nbytes random hex characters.
+
+    Draws from a per-thread buffer refilled from os.urandom in chunks,
+    so most calls cost no syscall.
+    """
+    buf = getattr(_rnd, "buf", b"")
+    pos = getattr(_rnd, "pos", 0)
+    if pos + nbytes > len(buf):
+        buf = _rnd.buf = os.urandom(max(_RND_CHUNK, nbytes))
+        pos = 0
+    _rnd.pos = pos + nbytes
+    return buf[pos:pos + nbytes].hex()
 
 
 def new_id(prefix: str = "MSG") -> str:
     """Generate a unique message ID."""
-    return f"{prefix}{uuid.uuid4().hex[:8]}"
+    return f"{prefix}{random_hex(4)}"
+
+
+# (epoch second, formatted timestamp); replaced as a whole so readers
+# never see a second paired with another second's string
+_ts_cache: Tuple[int, str] = (-1, "")
 
 
 def now_iso() -> str:
     """Generate current UTC timestamp in ISO 8601 format."""
-    return datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+    global _ts_cache
+    now = int(time.time())
+    sec, formatted = _ts_cache
+    if sec != now:
+        formatted = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))
+        _ts_cache = (now, formatted)
+    return formatted
 
 
 def _as_list(v: Any) -> List[Any]:
     """Normalize value to list."""
+    # Exact type check first: a pointer compare for the common case
+    if type(v) is list:
+        return v
     if v is None:
         return []
     if isinstance(v, list):
@@ -33,6 +72,48 @@ def _as_list(v: Any) -> List[Any]:
     return [v]
 
 
+def _schema_validate(msg: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+    """
+    Validate a message against the compiled VLP 1.1 schema.
+
+    Returns (ok, error_message).
+    """
+    try:
+        # First access loads the schema and compiles the validator
+        err = _schema.vlp_1_1_validator(msg)
+    except Exception as e:
+        return False, str(e)
+    return err is None, err
+
+
+# Message type -> (requires refers_to, requires non-empty provenance).
+# Evidence must cite what it supports and its sources; responses and
+# corrections must point at the message they answer or fix.
+_REFERENCE_RULES: Dict[str, Tuple[bool, bool]] = {
+    "evidence": (True, True),
+    "response": (True, False),
+    "correction": (True, False),
+}
+
+
+def _reference_validate(t: str, refers_to: Any, prov_list: List[Any]) -> Tuple[bool, Optional[str]]:
+    """
+    Validate the refers_to/provenance rules that depend on message type.
+
+    Returns (ok, error_message).
+    """
+    rule = _REFERENCE_RULES.get(t)
+    if rule is None:
+        return True, None
+
+    needs_refers_to, needs_provenance = rule
+    if needs_refers_to and not refers_to:
+        return False, f"{t} messages must include refers_to"
+    if needs_provenance and not prov_list:
+        return False, f"{t} messages must include non-empty provenance"
+    return True, None
+
+
 def _semantic_validate(msg: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
     """
     Validate VLP semantic rules ("Truth Serum").
@@ -53,23 +134,14 @@ def _semantic_validate(msg: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
         return False, "confidence must be a number"
 
     prov = msg.get("provenance", [])
-    prov_list = prov if isinstance(prov, list) else []
+    # Both schema backends accept tuples as JSON arrays, so count them too
+    prov_list = list(prov) if isinstance(prov, (list, tuple)) else []
     safety = msg.get("safety") if isinstance(msg.get("safety"), dict) else {"level": "safe", "issues": []}
     safety_level = str((safety or {}).get("level") or "safe")
 
-    refers_to = msg.get("refers_to")
-
-    # Evidence rules: must have refers_to and provenance
-    if t == "evidence":
-        if not refers_to:
-            return False, "evidence messages must include refers_to"
-        if not prov_list:
-            return False, "evidence messages must include non-empty provenance"
-
-    # Response/correction rules: must have refers_to
-    if t in ("response", "correction"):
-        if not refers_to:
-            return False, f"{t} messages must include refers_to"
+    ok, err = _reference_validate(t, msg.get("refers_to"), prov_list)
+    if not ok:
+        return ok, err
 
     # High confidence must be earned (provenance) or explicitly flagged for review
     if conf_f >= 0.9 and not prov_list and safety_level != "review":
@@ -84,17 +156,86 @@ def validate_vlp(msg: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
 
     Returns (ok, error_message).
     """
-    try:
-        validate(instance=msg, schema=vlp_1_1)
-    except ValidationError as e:
-        return False, str(e)
-    except Exception as e:
-        return False, str(e)
+    ok, err = _schema_validate(msg)
+    if not ok:
+        return ok, err
 
     ok, err = _semantic_validate(msg)
     return ok, err
 
 
+_VALIDATION_CACHE_SIZE = 4096
+_validation_cache: "OrderedDict[bytes, Tuple[bool, Optional[str]]]" = OrderedDict()
+_validation_cache_lock = threading.Lock()
+
+# Types orjson would otherwise encode natively are passed to _reject_non_json
+_CACHE_KEY_OPTIONS = (
+    orjson.OPT_SORT_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_PASSTHROUGH_SUBCLASS
+)
+
+
+def _reject_non_json(obj: Any) -> Any:
+    """orjson default hook: refuse anything that is not a plain JSON value."""
+    raise TypeError(f"not a JSON value: {type(obj).__name__}")
+
+
+def _validate_cached(msg: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+    """
+    Validate a message, memoizing the result on its canonical JSON encoding.
+
+    The encoding is only a cache key; the message itself is validated.
+    Messages whose encoding does not decode back to an equal value (UUIDs,
+    enums, tuples, NaN, datetimes, ...) bypass the cache, so a key never
+    stands for two messages that could validate differently.
+    """
+    try:
+        key = orjson.dumps(msg, default=_reject_non_json, option=_CACHE_KEY_OPTIONS)
+    except TypeError:
+        return validate_vlp(msg)
+    if orjson.loads(key) != msg:
+        return validate_vlp(msg)
+
+    with _validation_cache_lock:
+        result = _validation_cache.get(key)
+        if result is not None:
+            _validation_cache.move_to_end(key)
+            return result
+
+    result = validate_vlp(msg)
+    with _validation_cache_lock:
+        _validation_cache[key] = result
+        if len(_validation_cache) > _VALIDATION_CACHE_SIZE:
+            _validation_cache.popitem(last=False)
+    return result
+
+
+def validate_vlp_batch(
+    messages: Iterable[Dict[str, Any]],
+    cache: bool = False,
+) -> List[Tuple[bool, Optional[str]]]:
+    """
+    Validate many VLP messages, e.g. after NDJSON ingestion or replay.
+
+    With cache enabled, results are memoized (last 4096 distinct messages)
+    on each message's canonical JSON encoding, which speeds up re-validating
+    messages already seen on the fastjsonschema backend. With jsonschema-rs
+    installed, validating is cheaper than building the cache key, so the
+    cache is skipped. Encoding also costs extra on first sight, so only
+    enable it when messages are expected to repeat. Results are identical
+    either way.
+
+    Returns one (ok, error_message) tuple per message, in input order.
+    """
+    if cache and _schema.vlp_1_1_backend == "fastjsonschema":
+        validate = _validate_cached
+    else:
+        validate = validate_vlp
+    return [validate(msg) for msg in messages]
+
+
 def make_message(
     type_: str,
     sender: str,
@@ -116,20 +257,23 @@ def make_message(
     Raises:
         ValueError: If message fails validation
     """
+    get = kw.get
     t = str(type_).strip().lower()
-    confidence = float(kw.get("confidence", 1.0))
-    provenance = kw.get("provenance", [])
-    provenance_list = provenance if isinstance(provenance, list) else _as_list(provenance)
-    constraints = kw.get("constraints", [])
-    constraints_list = constraints if isinstance(constraints, list) else _as_list(constraints)
-
-    safety = kw.get("safety", {"level": "safe", "issues": []})
-    if not isinstance(safety, dict):
+    confidence = float(get("confidence", 1.0))
+    provenance_list = _as_list(get("provenance"))
+    constraints_list = _as_list(get("constraints"))
+
+    # Build a fresh safety dict so escalation below never mutates the caller's
+    safety = get("safety")
+    if isinstance(safety, dict):
+        issues = safety.get("issues")
+        safety = {
+            **safety,
+            "level": safety.get("level", "safe"),
+            "issues": list(issues) if isinstance(issues, list) else [],
+        }
+    else:
         safety = {"level": "safe", "issues": []}
-    if "issues" not in safety or not isinstance(safety.get("issues"), list):
-        safety["issues"] = []
-    if "level" not in safety:
-        safety["level"] = "safe"
 
     # v1.1 behavior: if sender claims high confidence without provenance, auto-escalate to review
     if confidence >= 0.9 and not provenance_list and str(safety.get("level")) != "review":
@@ -140,43 +284,88 @@ def make_message(
         })
 
     # Keywords for searchable agent memory
-    keywords = kw.get("keywords", [])
-    keywords_list = keywords if isinstance(keywords, list) else _as_list(keywords)
-    # Normalize keywords: lowercase, strip whitespace, dedupe
-    keywords_list = list(dict.fromkeys(
-        k.lower().strip() for k in keywords_list if isinstance(k, str) and k.strip()
-    ))
-
+    keywords_list = _as_list(get("keywords"))
+    # Normalize keywords: lowercase, strip whitespace, dedupe (order-preserving)
+    if keywords_list:
+        seen = set()
+        normalized: List[str] = []
+        for k in keywords_list:
+            if not isinstance(k, str):
+                continue
+            k = k.strip().lower()
+            if k and k not in seen:
+                seen.add(k)
+                normalized.append(k)
+        keywords_list = normalized
+
+    # Optional fields are only included when set, keeping null/empty
+    # slots out of the dict and off the NDJSON wire.
     msg: Dict[str, Any] = {
-        "id": kw.get("id") or new_id(),
+        "id": get("id") or new_id(),
         "protocol": "VLP/1.1",
         "type": t,
-        "timestamp": kw.get("timestamp") or now_iso(),
-        "session_id": kw.get("session_id"),
-        "seq": kw.get("seq"),
-        "sender": sender,
-        "receiver": kw.get("receiver"),
-        "topic": kw.get("topic"),
-        "content": content,
-        "confidence": confidence,
-        "provenance": provenance_list,
-        "constraints": constraints_list,
-        "safety": safety,
-        "refers_to": kw.get("refers_to"),
-        "keywords": keywords_list,
-        "payload": kw.get("payload"),
-        "_extras": kw.get("_extras", {}),
+        "timestamp": get("timestamp") or now_iso(),
     }
-
-    ok, err = validate_vlp(msg)
+    if (v := get("session_id")) is not None:
+        msg["session_id"] = v
+    if (v := get("seq")) is not None:
+        msg["seq"] = v
+    msg["sender"] = sender
+    if (v := get("receiver")) is not None:
+        msg["receiver"] = v
+    if (v := get("topic")) is not None:
+        msg["topic"] = v
+    msg["content"] = content
+    msg["confidence"] = confidence
+    msg["provenance"] = provenance_list
+    msg["constraints"] = constraints_list
+    msg["safety"] = safety
+    refers_to = get("refers_to")
+    if refers_to is not None:
+        msg["refers_to"] = refers_to
+    msg["keywords"] = keywords_list
+    if (v := get("payload")) is not None:
+        msg["payload"] = v
+    if (v := get("_extras")) is not None and v != {}:
+        msg["_extras"] = v
+
+    # Lowercase type, numeric confidence and the high-confidence review
+    # escalation are guaranteed above, so only the schema and the
+    # caller-dependent reference rules need checking here.
+    ok, err = _schema_validate(msg)
+    if ok:
+        ok, err = _reference_validate(t, refers_to, provenance_list)
     if not ok:
         raise ValueError(f"VLP validation failed: {err}")
     return msg
 
 
-def to_ndjson(messages: List[Dict[str, Any]]) -> str:
+def to_ndjson(messages: Iterable[Dict[str, Any]]) -> str:
     """Convert list of messages to NDJSON format."""
-    return "\n".join(json.dumps(m, ensure_ascii=False) for m in messages)
+    buf = bytearray()
+    dump = orjson.dumps
+    for m in messages:
+        if buf:
+            buf += b"\n"
+        buf += dump(m, option=orjson.OPT_NON_STR_KEYS)
+    return buf.decode("utf-8")
+
+
+def to_ndjson_stream(messages: Iterable[Dict[str, Any]], fp: BinaryIO) -> int:
+    """
+    Write messages as NDJSON to a binary file object, one line per message.
+
+    Unlike to_ndjson, the full output is never held in memory.
+
+    Returns the number of messages written.
+    """
+    dump = orjson.dumps
+    write = fp.write
+    n = 0
+    for m in messages:
+        write(dump(m, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE))
+        n += 1
+    return n
 
 
 def from_ndjson(text: str) -> List[Dict[str, Any]]:
@@ -185,5 +374,5 @@ def from_ndjson(text: str) -> List[Dict[str, Any]]:
     for line in (text or "").splitlines():
         if not line.strip():
             continue
-        out.append(json.loads(line))
+        out.append(orjson.loads(line))
     return out
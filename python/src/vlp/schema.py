@@ -2,25 +2,117 @@
 
 from __future__ import annotations
 
+import functools
 import json
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Optional
 
 _DIR = Path(__file__).resolve().parent
 _SCHEMA_PATH = _DIR / "vlp-1.1.json"
 
 
-def _load_schema() -> Dict[str, Any]:
-    """Load the VLP 1.1 JSON schema."""
+@functools.lru_cache(maxsize=None)
+def _schema_path() -> Path:
+    """Locate the VLP 1.1 schema file (memoized once found)."""
     if _SCHEMA_PATH.exists():
-        return json.loads(_SCHEMA_PATH.read_text(encoding="utf-8"))
+        return _SCHEMA_PATH
 
     # Fallback: look in parent schema directory
     alt_path = _DIR.parent.parent.parent / "schema" / "vlp-1.1.json"
     if alt_path.exists():
-        return json.loads(alt_path.read_text(encoding="utf-8"))
+        return alt_path
 
     raise FileNotFoundError(f"VLP schema not found at {_SCHEMA_PATH} or {alt_path}")
 
 
-vlp_1_1: Dict[str, Any] = _load_schema()
+def _load_schema() -> Dict[str, Any]:
+    """Load the VLP 1.1 JSON schema."""
+    return json.loads(_schema_path().read_text(encoding="utf-8"))
+
+
+def _rs_draft7_validator() -> Any:
+    """Return jsonschema-rs's Draft7Validator class, or None if unavailable."""
+    try:
+        import jsonschema_rs
+    except ImportError:  # Optional accelerator: pip install vlp[fast]
+        return None
+    # Draft7Validator first shipped in jsonschema-rs 0.20
+    return getattr(jsonschema_rs, "Draft7Validator", None)
+
+
+def _compile_validator(schema: Dict[str, Any], prefer_rs: bool = True) -> Callable[[Any], Optional[str]]:
+    """
+    Compile a schema into a check function returning an error message or None.
+
+    fastjsonschema is the reference backend. When jsonschema-rs is installed
+    (and prefer_rs is set) it answers the common "valid" case; anything it
+    rejects or cannot convert (NaN, str subclasses, ...) is re-checked with
+    fastjsonschema, so verdicts and error messages never depend on which
+    backend is installed. Backends are imported here so importing vlp stays
+    cheap.
+    """
+    import fastjsonschema
+
+    # use_default=False: never write schema defaults into the validated message
+    compiled_fast = fastjsonschema.compile(schema, use_default=False)
+
+    def check_fast(instance: Any) -> Optional[str]:
+        try:
+            compiled_fast(instance)
+        except fastjsonschema.JsonSchemaValueException as e:
+            return e.message
+        return None
+
+    draft7 = _rs_draft7_validator() if prefer_rs else None
+    if draft7 is None:
+        return check_fast
+
+    is_valid = draft7(schema).is_valid
+
+    def check_rs(instance: Any) -> Optional[str]:
+        try:
+            if is_valid(instance):
+                return None
+        except (TypeError, ValueError):
+            pass  # Not representable in jsonschema-rs, e.g. a str subclass
+        return check_fast(instance)
+
+    return check_rs
+
+
+vlp_1_1: Dict[str, Any]
+vlp_1_1_validator: Callable[[Any], Optional[str]]
+# Backend answering the valid case: "jsonschema-rs" or "fastjsonschema"
+vlp_1_1_backend: str
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Load the schema and compile its validator on first access (PEP 562).
+
+    The result is cached in module globals, so later lookups bypass this hook.
+    """
+    if name == "vlp_1_1":
+        value: Any = _load_schema()
+    elif name == "vlp_1_1_validator":
+        value = _compile_validator(globals().get("vlp_1_1") or __getattr__("vlp_1_1"))
+    elif name == "vlp_1_1_backend":
+        value = "jsonschema-rs" if _rs_draft7_validator() is not None else "fastjsonschema"
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def preload() -> None:
+    """
+    Load the schema and compile its validator now instead of on first use.
+
+    Call this in a pre-forking server's parent process (e.g. at import time
+    with Gunicorn's preload_app, or before creating a multiprocessing.Pool)
+    so workers inherit the compiled validator instead of each building
+    their own.
+    """
+    for name in ("vlp_1_1_validator", "vlp_1_1_backend"):
+        if name not in globals():
+            __getattr__(name)
@@ -6,12 +6,11 @@ Provides session tracking for grouping related VLP messages.
 
 from __future__ import annotations
 
-import datetime
-import threading
-import uuid
+import itertools
+import time
 from typing import Any, Dict, Optional
 
-from .runtime import make_message
+from .runtime import make_message, now_iso, random_hex
 
 
 class AgentSession:
@@ -35,27 +34,29 @@ class AgentSession:
         self.agent_name = agent_name
         self.agent_number = agent_number
         self.session_id = self._generate_session_id(agent_name)
-        self.started_at = datetime.datetime.now(datetime.timezone.utc).isoformat().replace("+00:00", "Z")
+        self.started_at = now_iso()
         self.seq = 0
-        self._lock = threading.Lock()
+        self._suffix = self.session_id[-6:]
+        self._counter = itertools.count(1)
 
     def _generate_session_id(self, agent_name: str) -> str:
         """Generate a unique session ID with agent prefix."""
         # Format: S-{date}-{agent_slug}-{short_uuid}
-        date = datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%d")
+        date = time.strftime("%Y-%m-%d", time.gmtime())
         slug = agent_name.lower().replace("the ", "").replace(" ", "-")[:12]
-        short_id = uuid.uuid4().hex[:6]
+        short_id = random_hex(3)
         return f"S-{date}-{slug}-{short_id}"
 
     def next_seq(self) -> int:
         """Get next sequence number (thread-safe)."""
-        with self._lock:
-            self.seq += 1
-            return self.seq
+        # next() on itertools.count is atomic under the GIL, so no lock is needed
+        seq = next(self._counter)
+        self.seq = seq
+        return seq
 
     def message_id(self, prefix: str = "MSG") -> str:
         """Generate a session-scoped message ID."""
-        return f"{prefix}-{self.session_id[-6:]}-{self.next_seq():04d}"
+        return f"{prefix}-{self._suffix}-{self.next_seq():04d}"
 
 
 class AgentSessionRegistry:
@@ -74,8 +75,8 @@ class AgentSessionRegistry:
     """
 
     def __init__(self):
+        # Single-key dict operations are atomic under the GIL, so no lock is needed
         self._sessions: Dict[str, AgentSession] = {}
-        self._lock = threading.Lock()
 
     def start_session(self, agent_name: str, agent_number: int = 0) -> AgentSession:
         """
@@ -85,15 +86,13 @@ class AgentSessionRegistry:
         """
         session = AgentSession(agent_name, agent_number)
 
-        with self._lock:
-            self._sessions[session.session_id] = session
+        self._sessions[session.session_id] = session
 
         return session
 
     def get_session(self, session_id: str) -> Optional[AgentSession]:
         """Get an active session by ID."""
-        with self._lock:
-            return self._sessions.get(session_id)
+        return self._sessions.get(session_id)
 
     def end_session(self, session: AgentSession, summary: str = "") -> Dict[str, Any]:
         """
@@ -113,13 +112,12 @@ class AgentSessionRegistry:
             payload={
                 "agent_number": session.agent_number,
                 "started_at": session.started_at,
-                "ended_at": datetime.datetime.now(datetime.timezone.utc).isoformat().replace("+00:00", "Z"),
+                "ended_at": now_iso(),
                 "total_messages": session.seq,
             },
         )
 
-        with self._lock:
-            self._sessions.pop(session.session_id, None)
+        self._sessions.pop(session.session_id, None)
 
         return msg
 
@@ -0,0 +1,43 @@
+"""Tests for VLP message batches."""
+
+import pytest
+from vlp import MessageBatch, make_message, validate_vlp_batch, to_ndjson, from_ndjson
+
+
+@pytest.fixture
+def messages():
+    return [
+        make_message("claim", "A", "One", confidence=0.95, provenance=["log"], session_id="S1"),
+        make_message("claim", "B", "Two", confidence=0.5, session_id="S2"),
+        make_message("query", "A", "Three?", confidence=0.95, session_id="S1"),
+    ]
+
+
+class TestMessageBatch:
+    def test_roundtrip(self, messages):
+        batch = MessageBatch(messages)
+        assert len(batch) == 3
+        assert list(batch) == messages
+        assert batch[1] == messages[1]
+
+    def test_preserves_absent_and_extra_keys(self):
+        msg = {"id": "MSG001", "content": "Partial", "x-custom": 1}
+        batch = MessageBatch([msg])
+        assert batch[0] == msg
+        assert batch.column("sender") == [None]
+
+    def test_column(self, messages):
+        batch = MessageBatch(messages)
+        assert batch.column("confidence") == [0.95, 0.5, 0.95]
+
+    def test_where(self, messages):
+        batch = MessageBatch(messages)
+        confident = batch.where(type_="claim", min_confidence=0.9)
+        assert list(confident) == [messages[0]]
+        assert list(batch.where(session_id="S1")) == [messages[0], messages[2]]
+        assert len(batch.where(type_="evidence")) == 0
+
+    def test_export_and_validate(self, messages):
+        batch = MessageBatch(messages)
+        assert from_ndjson(to_ndjson(batch)) == messages
+        assert all(ok for ok, _ in validate_vlp_batch(batch))
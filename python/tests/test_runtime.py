@@ -1,7 +1,9 @@
 """Tests for VLP runtime."""
 
+import io
+
 import pytest
-from vlp import make_message, validate_vlp, new_id, now_iso, to_ndjson, from_ndjson
+from vlp import make_message, validate_vlp, validate_vlp_batch, new_id, random_hex, now_iso, to_ndjson, to_ndjson_stream, from_ndjson
 
 
 class TestNewId:
@@ -14,6 +16,19 @@ class TestNewId:
         id_ = new_id("CLM")
         assert id_.startswith("CLM")
 
+    def test_hex_and_distinct_across_buffer_refills(self):
+        ids = [new_id() for _ in range(1000)]
+        assert all(int(i[3:], 16) >= 0 and len(i) == 11 for i in ids)
+        assert len(set(ids)) > 990
+
+
+class TestRandomHex:
+    def test_length_and_hex(self):
+        for n in (1, 3, 4, 2048):
+            h = random_hex(n)
+            assert len(h) == 2 * n
+            int(h, 16)
+
 
 class TestNowIso:
     def test_format(self):
@@ -22,6 +37,14 @@ class TestNowIso:
         assert "T" in ts
         assert len(ts) == 20  # YYYY-MM-DDTHH:MM:SSZ
 
+    def test_follows_clock_across_seconds(self, monkeypatch):
+        import time
+
+        monkeypatch.setattr(time, "time", lambda: 0.5)
+        assert now_iso() == "1970-01-01T00:00:00Z"
+        monkeypatch.setattr(time, "time", lambda: 61.2)
+        assert now_iso() == "1970-01-01T00:01:01Z"
+
 
 class TestMakeMessage:
     def test_basic_claim(self):
@@ -57,6 +80,23 @@ class TestMakeMessage:
         )
         assert msg["safety"]["level"] == "safe"
 
+    def test_caller_safety_not_mutated(self):
+        safety = {"level": "safe", "issues": [], "requires_human": True}
+        msg = make_message(
+            "claim",
+            sender="TestAgent",
+            content="High confidence claim",
+            confidence=0.95,
+            safety=safety
+        )
+        assert msg["safety"]["level"] == "review"
+        assert msg["safety"]["requires_human"] is True
+        assert safety == {"level": "safe", "issues": [], "requires_human": True}
+
+    def test_scalar_provenance_wrapped(self):
+        msg = make_message("claim", "TestAgent", "Test", confidence=0.5, provenance="source1")
+        assert msg["provenance"] == ["source1"]
+
     def test_keywords_normalized(self):
         msg = make_message(
             "claim",
@@ -67,6 +107,12 @@ class TestMakeMessage:
         )
         assert msg["keywords"] == ["research", "oklahoma", "test"]
 
+    def test_unset_optional_fields_omitted(self):
+        msg = make_message("claim", "TestAgent", "Test", confidence=0.5)
+        for key in ("session_id", "seq", "receiver", "topic", "refers_to", "payload", "_extras"):
+            assert key not in msg
+        assert "null" not in to_ndjson([msg])
+
     def test_session_fields(self):
         msg = make_message(
             "claim",
@@ -87,6 +133,27 @@ class TestValidateVlp:
         assert ok is True
         assert err is None
 
+    def test_does_not_modify_input_on_fastjsonschema(self, monkeypatch):
+        from vlp import schema
+
+        fast = schema._compile_validator(schema.vlp_1_1, prefer_rs=False)
+        monkeypatch.setattr(schema, "vlp_1_1_validator", fast)
+        msg = from_ndjson(to_ndjson([make_message("claim", "Test", "Content", confidence=0.5)]))[0]
+        for key in ("provenance", "constraints", "safety", "keywords"):
+            del msg[key]
+        before = dict(msg)
+        assert validate_vlp(msg) == (True, None)
+        assert msg == before
+
+    def test_tuple_provenance_counts_as_provenance(self):
+        msg = make_message("evidence", "Test", "Proof", confidence=0.95, provenance=["src"], refers_to="MSG001")
+        msg["provenance"] = ("src",)
+        assert validate_vlp(msg) == (True, None)
+
+        msg = make_message("claim", "Test", "Sure", confidence=0.95, provenance=["src"])
+        msg["provenance"] = ("src",)
+        assert validate_vlp(msg) == (True, None)
+
     def test_missing_confidence(self):
         msg = {
             "id": "MSG001",
@@ -110,6 +177,14 @@ class TestValidateVlp:
                 provenance=["source"]
             )
 
+    def test_make_message_rejects_out_of_range_confidence(self):
+        with pytest.raises(ValueError, match="confidence"):
+            make_message("claim", "Test", "Content", confidence=1.5)
+
+    def test_response_requires_refers_to(self):
+        with pytest.raises(ValueError, match="refers_to"):
+            make_message("response", "Test", "Answer", confidence=0.5)
+
     def test_evidence_requires_provenance(self):
         with pytest.raises(ValueError, match="provenance"):
             make_message(
@@ -121,6 +196,66 @@ class TestValidateVlp:
             )
 
 
+class TestValidateVlpBatch:
+    def test_matches_validate_vlp(self):
+        good = make_message("claim", "Test", "Content", confidence=0.5)
+        bad_schema = {"id": "MSG001", "protocol": "VLP/1.1"}
+        bad_semantic = dict(good, type="response")
+        msgs = [good, bad_schema, bad_semantic]
+
+        results = validate_vlp_batch(msgs)
+
+        assert results == [validate_vlp(m) for m in msgs]
+        assert [ok for ok, _ in results] == [True, False, False]
+
+    def test_empty(self):
+        assert validate_vlp_batch([]) == []
+
+    @pytest.fixture
+    def fast_backend(self, monkeypatch):
+        from vlp import schema
+
+        fast = schema._compile_validator(schema.vlp_1_1, prefer_rs=False)
+        monkeypatch.setattr(schema, "vlp_1_1_validator", fast)
+        monkeypatch.setattr(schema, "vlp_1_1_backend", "fastjsonschema")
+
+    def test_cache_skipped_on_rust_backend(self, monkeypatch):
+        from vlp import runtime, schema
+
+        monkeypatch.setattr(schema, "vlp_1_1_backend", "jsonschema-rs")
+        monkeypatch.setattr(runtime, "_validation_cache", runtime.OrderedDict())
+        msg = make_message("claim", "Test", "Content", confidence=0.5)
+        assert validate_vlp_batch([msg], cache=True) == [(True, None)]
+        assert len(runtime._validation_cache) == 0
+
+    def test_cache_keyed_on_content(self, fast_backend):
+        good = make_message("claim", "Test", "Content", confidence=0.5)
+        # Same id, different content: must not reuse the cached result
+        bad = dict(good, confidence=2.0)
+        assert validate_vlp_batch([good, bad, good], cache=True) == [(True, None), validate_vlp(bad), (True, None)]
+        assert validate_vlp_batch([bad]) == [validate_vlp(bad)]
+
+    def test_unencodable_falls_back(self, fast_backend):
+        msg = make_message("claim", "Test", "Content", confidence=0.5)
+        msg["_extras"] = {"tags": {"a"}}
+        assert validate_vlp_batch([msg], cache=True) == [validate_vlp(msg)]
+
+    def test_cache_matches_validate_vlp_for_non_json_values(self, fast_backend):
+        import datetime
+        import uuid
+
+        uid = uuid.uuid4()
+        good = make_message("claim", "Test", "Content", confidence=0.5, id=str(uid))
+        with_uuid = dict(good, id=uid)
+        with_datetime = dict(good, timestamp=datetime.datetime.now())
+        with_tuple = dict(good, type="evidence", refers_to="MSG001", provenance=("src",))
+        msgs = [good, with_uuid, with_datetime, with_tuple]
+
+        # Warm the cache with the JSON-pure twin first, then check the others
+        assert validate_vlp_batch(msgs, cache=True) == [validate_vlp(m) for m in msgs]
+        assert validate_vlp(with_uuid)[0] is False
+
+
 class TestNdjson:
     def test_to_ndjson(self):
         msgs = [
@@ -131,6 +266,28 @@ class TestNdjson:
         lines = result.strip().split("\n")
         assert len(lines) == 2
 
+    def test_non_str_keys_stringified(self):
+        msg = make_message("claim", "T", "x", confidence=0.5, payload={1: "a"})
+        assert from_ndjson(to_ndjson([msg]))[0]["payload"] == {"1": "a"}
+        fp = io.BytesIO()
+        to_ndjson_stream([msg], fp)
+        assert from_ndjson(fp.getvalue().decode("utf-8"))[0]["payload"] == {"1": "a"}
+
+    def test_to_ndjson_empty(self):
+        assert to_ndjson([]) == ""
+
+    def test_to_ndjson_stream(self):
+        msgs = [
+            {"id": "MSG001", "content": "First"},
+            {"id": "MSG002", "content": "Second"}
+        ]
+        fp = io.BytesIO()
+        assert to_ndjson_stream(msgs, fp) == 2
+        text = fp.getvalue().decode("utf-8")
+        assert text.endswith("\n")
+        assert from_ndjson(text) == msgs
+        assert text.rstrip("\n") == to_ndjson(msgs)
+
     def test_from_ndjson(self):
         text = '{"id": "MSG001"}\n{"id": "MSG002"}\n'
         msgs = from_ndjson(text)
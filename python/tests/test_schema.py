@@ -0,0 +1,87 @@
+"""Tests for VLP schema loading and compiled validators."""
+
+import pytest
+from vlp import schema
+
+
+@pytest.fixture(params=[True, False], ids=["default", "fastjsonschema"])
+def validator(request):
+    return schema._compile_validator(schema.vlp_1_1, prefer_rs=request.param)
+
+
+VALID = {
+    "id": "MSG001",
+    "protocol": "VLP/1.1",
+    "type": "claim",
+    "timestamp": "2025-01-04T10:00:00Z",
+    "sender": "Test",
+    "content": "Test",
+    "confidence": 0.5,
+}
+
+
+class TestCompiledValidator:
+    def test_valid(self, validator):
+        assert validator(VALID) is None
+
+    def test_missing_required(self, validator):
+        msg = dict(VALID)
+        del msg["confidence"]
+        assert "confidence" in validator(msg)
+
+    def test_out_of_range(self, validator):
+        err = validator(dict(VALID, confidence=1.5))
+        assert "confidence" in err
+
+    def test_input_not_modified(self, validator):
+        msg = dict(VALID)
+        assert validator(msg) is None
+        assert msg == VALID
+
+    def test_bad_type(self, validator):
+        assert validator(dict(VALID, type="gossip")) is not None
+
+
+class _Str(str):
+    pass
+
+
+# Inputs where the raw backends used to disagree; fastjsonschema is the reference
+PARITY_CASES = {
+    "nan_confidence": dict(VALID, confidence=float("nan")),
+    "str_subclass": dict(VALID, sender=_Str("Test")),
+    "bool_confidence": dict(VALID, confidence=True),
+    "tuple_array": dict(VALID, provenance=("src",)),
+    "float_seq": dict(VALID, seq=1.0),
+    "unsupported_type": dict(VALID, id=object()),
+}
+
+
+class TestBackendParity:
+    @pytest.mark.parametrize("case", sorted(PARITY_CASES))
+    def test_same_result_on_both_backends(self, case):
+        msg = PARITY_CASES[case]
+        default = schema._compile_validator(schema.vlp_1_1)
+        fast = schema._compile_validator(schema.vlp_1_1, prefer_rs=False)
+        assert default(msg) == fast(msg)
+
+
+class TestBackendSelection:
+    def test_old_jsonschema_rs_falls_back(self, monkeypatch):
+        import sys
+        import types
+
+        # jsonschema-rs < 0.20 only has JSONSchema, no Draft7Validator
+        monkeypatch.setitem(sys.modules, "jsonschema_rs", types.ModuleType("jsonschema_rs"))
+        validator = schema._compile_validator(schema.vlp_1_1)
+        assert validator(VALID) is None
+        assert "confidence" in validator(dict(VALID, confidence=1.5))
+
+
+class TestPreload:
+    def test_preload_is_idempotent(self):
+        schema.preload()
+        validator = schema.vlp_1_1_validator
+        schema.preload()
+        assert schema.vlp_1_1_validator is validator
+        assert validator(VALID) is None
@@ -1,5 +1,7 @@
 """Tests for VLP session management."""
 
+import threading
+
 import pytest
 from vlp.sessions import AgentSession, AgentSessionRegistry, get_registry
 
@@ -17,6 +19,21 @@ class TestAgentSession:
         assert session.next_seq() == 2
         assert session.next_seq() == 3
 
+    def test_seq_unique_across_threads(self):
+        session = AgentSession("Test", 1)
+        seen = []
+
+        def worker():
+            seen.extend(session.next_seq() for _ in range(500))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert sorted(seen) == list(range(1, 2001))
+
     def test_message_id_format(self):
         session = AgentSession("Test", 1)
         msg_id = session.message_id("CLM")